@@ -1,12 +1,12 @@
 import { ref, push } from "firebase/database";
 import { db } from "@/firebase";
 
+const foodItemsRef = ref(db, "foodItems");
+
 export async function POST(request: Request) {
   try {
     const { itemName, quantity } = await request.json();
 
-    const foodItemsRef = ref(db, "foodItems");
-
     const newItem = {
       itemName,
       quantity,